@@ -0,0 +1,95 @@
+# Benchmark the per-request cost of PEM key validation and loading
+# Run this script from the server directory: python src/bench_pem.py
+# Compares the previous two-pass flow (base64 validate, then load_pem_*)
+# against the single-pass scanner that decodes once and loads via load_der_*
+
+import base64
+import timeit
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from crypto_utils import (
+    _load_private_key,
+    _load_public_key,
+    _scan_pem,
+    _validate_pem_footer,
+    _validate_pem_header,
+    _validate_pem_structure,
+    _validate_private_key_format,
+    _validate_public_key_format,
+)
+
+# Private key loading is dominated by OpenSSL's RSA consistency check,
+# so it runs far fewer iterations than the public key path
+PUBLIC_ITERATIONS = 2000
+PRIVATE_ITERATIONS = 20
+
+private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+private_pem = private_key.private_bytes(
+    encoding=serialization.Encoding.PEM,
+    format=serialization.PrivateFormat.PKCS8,
+    encryption_algorithm=serialization.NoEncryption(),
+).decode()
+
+public_pem = (
+    private_key.public_key()
+    .public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    .decode()
+)
+
+
+def validate_two_pass(key_pem, label, key_type):
+    # Same checks as the previous flow, whose decoded body was discarded
+    pem_lines = key_pem.strip().splitlines()
+    _validate_pem_structure(pem_lines, key_type)
+    _validate_pem_header(pem_lines[0], f"-----BEGIN {label}-----", key_type)
+    _validate_pem_footer(pem_lines[-1], f"-----END {label}-----", key_type)
+    base64.b64decode("".join(pem_lines[1:-1]), validate=True)
+
+
+def two_pass_public():
+    _validate_public_key_format(public_pem)
+    validate_two_pass(public_pem, "PUBLIC KEY", "public")
+    return serialization.load_pem_public_key(public_pem.encode())
+
+
+def single_pass_public():
+    _validate_public_key_format(public_pem)
+    return _load_public_key(_scan_pem(public_pem, "PUBLIC KEY", "public"))
+
+
+def two_pass_private():
+    _validate_private_key_format(private_pem)
+    validate_two_pass(private_pem, "PRIVATE KEY", "private")
+    return serialization.load_pem_private_key(private_pem.encode(), password=None)
+
+
+def single_pass_private():
+    _validate_private_key_format(private_pem)
+    return _load_private_key(_scan_pem(private_pem, "PRIVATE KEY", "private"))
+
+
+def scan_only_public():
+    return _scan_pem(public_pem, "PUBLIC KEY", "public")
+
+
+def report(name, func, iterations):
+    seconds = timeit.timeit(func, number=iterations)
+    micros = seconds / iterations * 1_000_000
+    print(f"{name:<22} {micros:10.1f} us/request")
+
+
+print("=" * 50)
+print("PEM validation + load")
+print("=" * 50)
+report("pem scan only", scan_only_public, PUBLIC_ITERATIONS)
+report("public  two-pass", two_pass_public, PUBLIC_ITERATIONS)
+report("public  single-pass", single_pass_public, PUBLIC_ITERATIONS)
+report("private two-pass", two_pass_private, PRIVATE_ITERATIONS)
+report("private single-pass", single_pass_private, PRIVATE_ITERATIONS)
+print("=" * 50)
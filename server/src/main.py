@@ -2,12 +2,21 @@ import time
 
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from .crypto_utils import decrypt_data, encrypt_data
-from .database import Base, engine, get_db
+from .crypto_utils import decrypt_cache, decrypt_data, encrypt_data
+from .database import (
+    Base,
+    engine,
+    get_db,
+    get_primary_session,
+    get_read_db,
+    mark_replica_failed,
+)
 from .models import LogEntry as Log
 from .schemas import (
+    CacheStatsResponse,
     CryptoResponse,
     DecryptRequest,
     EncryptRequest,
@@ -49,6 +58,16 @@ def create_log(db: Session, ip: str, data: str, operation: str):
     return log
 
 
+def query_logs(db: Session, size: int, offset: int):
+    """Helper function to fetch total count and a page of logs"""
+    # Get total count
+    total = db.query(Log).count()
+
+    # Get paginated logs, ordered by timestamp descending
+    logs = db.query(Log).order_by(Log.timestamp.desc()).offset(offset).limit(size).all()
+    return total, logs
+
+
 @app.get("/")  # health check endpoint
 def root():
     return {"message": "SecureLog API is running"}
@@ -110,14 +129,17 @@ async def decrypt_endpoint(
 def get_logs(
     size: int = Query(10, ge=1, le=100, description="Number of logs per page"),
     offset: int = Query(0, ge=0, description="Number of logs to skip"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get paginated logs"""
-    # Get total count
-    total = db.query(Log).count()
-
-    # Get paginated logs, ordered by timestamp descending
-    logs = db.query(Log).order_by(Log.timestamp.desc()).offset(offset).limit(size).all()
+    try:
+        total, logs = query_logs(db, size, offset)
+    except SQLAlchemyError:
+        if not mark_replica_failed(db):
+            raise
+        # Read replica failed mid-request, retry against the primary
+        with get_primary_session() as primary_db:
+            total, logs = query_logs(primary_db, size, offset)
 
     # Convert to response format
     log_responses = [
@@ -134,6 +156,12 @@ def get_logs(
     return LogsResponse(logs=log_responses, total=total, size=size, offset=offset)
 
 
+@app.get("/api/v1/decrypt/cache", response_model=CacheStatsResponse)
+def get_decrypt_cache_stats():
+    """Get decrypt result cache size and hit rate"""
+    return CacheStatsResponse(**decrypt_cache.stats())
+
+
 @app.post("/api/v1/generate-keys", response_model=KeyPairResponse)
 async def generate_keys():
     """Generate a new RSA key pair"""
@@ -46,3 +46,15 @@ class LogsResponse(BaseModel):
     total: int
     size: int
     offset: int
+
+
+class CacheStatsResponse(BaseModel):
+    enabled: bool
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
@@ -0,0 +1,133 @@
+# Tests for the decrypt result cache
+# Run from the server directory: python -m pytest src/test_decrypt_cache.py
+
+import hashlib
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+import crypto_utils
+from crypto_utils import DECRYPT_CACHE_ENTRY_OVERHEAD_BYTES, DecryptCache
+
+
+def make_key(index: int) -> tuple:
+    digest = hashlib.sha256(str(index).encode()).digest()
+    return (digest, digest)
+
+
+def make_pem_pair() -> tuple:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    return public_pem, private_pem
+
+
+def test_empty_plaintexts_are_evicted_at_the_memory_bound():
+    max_entries = 100
+    cache = DecryptCache(
+        enabled=True,
+        max_bytes=max_entries * DECRYPT_CACHE_ENTRY_OVERHEAD_BYTES,
+        ttl_seconds=300,
+    )
+
+    for index in range(10_000):
+        cache.put(make_key(index), "")
+
+    stats = cache.stats()
+    assert stats["entries"] == max_entries
+    assert stats["size_bytes"] <= stats["max_bytes"]
+    assert stats["evictions"] == 10_000 - max_entries
+    assert cache.get(make_key(0)) is None
+    assert cache.get(make_key(9_999)) == ""
+
+
+def test_evicted_plaintext_is_zeroized():
+    cache = DecryptCache(
+        enabled=True,
+        max_bytes=DECRYPT_CACHE_ENTRY_OVERHEAD_BYTES + 16,
+        ttl_seconds=300,
+    )
+    cache.put(make_key(0), "secret")
+    buffer, _ = cache._entries[make_key(0)]
+
+    cache.put(make_key(1), "another")
+
+    assert cache.get(make_key(0)) is None
+    assert buffer == bytearray(len("secret"))
+
+
+def test_expired_entry_is_a_miss_and_zeroized(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(crypto_utils.time, "monotonic", lambda: now[0])
+    cache = DecryptCache(enabled=True, max_bytes=1048576, ttl_seconds=60)
+    cache.put(make_key(0), "secret")
+    buffer, _ = cache._entries[make_key(0)]
+
+    now[0] += 59
+    assert cache.get(make_key(0)) == "secret"
+
+    now[0] += 1
+    assert cache.get(make_key(0)) is None
+    assert buffer == bytearray(len("secret"))
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["size_bytes"] == 0
+
+
+def test_get_makes_entry_most_recently_used():
+    cache = DecryptCache(
+        enabled=True,
+        max_bytes=2 * DECRYPT_CACHE_ENTRY_OVERHEAD_BYTES,
+        ttl_seconds=300,
+    )
+    cache.put(make_key(0), "")
+    cache.put(make_key(1), "")
+
+    assert cache.get(make_key(0)) == ""
+    cache.put(make_key(2), "")
+
+    assert cache.get(make_key(1)) is None
+    assert cache.get(make_key(0)) == ""
+    assert cache.get(make_key(2)) == ""
+
+
+def test_failed_decrypt_is_not_cached(monkeypatch):
+    public_pem, _ = make_pem_pair()
+    _, other_private_pem = make_pem_pair()
+    cache = DecryptCache(enabled=True, max_bytes=1048576, ttl_seconds=300)
+    monkeypatch.setattr(crypto_utils, "decrypt_cache", cache)
+
+    ciphertext = crypto_utils.encrypt_data(public_pem, "Hello Blueprint!")
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Decryption failed"):
+            crypto_utils.decrypt_data(other_private_pem, ciphertext)
+
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["hits"] == 0
+
+
+def test_cache_hit_skips_private_key_load(monkeypatch):
+    public_pem, private_pem = make_pem_pair()
+    cache = DecryptCache(enabled=True, max_bytes=1048576, ttl_seconds=300)
+    monkeypatch.setattr(crypto_utils, "decrypt_cache", cache)
+
+    ciphertext = crypto_utils.encrypt_data(public_pem, "Hello Blueprint!")
+    assert crypto_utils.decrypt_data(private_pem, ciphertext) == "Hello Blueprint!"
+
+    def fail_load(private_key_der, label):
+        raise AssertionError("private key loaded on a cache hit")
+
+    monkeypatch.setattr(crypto_utils, "_load_private_key", fail_load)
+    assert crypto_utils.decrypt_data(private_pem, ciphertext) == "Hello Blueprint!"
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,181 @@
+# Tests for PEM label/body validation in crypto_utils
+# Run from the server directory: python -m pytest src/test_pem_validation.py
+
+import base64
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from crypto_utils import _der_matches_label, decrypt_data, encrypt_data
+
+INVALID_PUBLIC_KEY = (
+    "Invalid RSA public key: The key format is correct but the "
+    "key data is invalid. Please ensure:\n"
+    "- You're using an RSA public key (not EC, DSA, or other types)\n"
+    "- The key was generated correctly\n"
+    "- You copied the entire key without modifications"
+)
+INVALID_PRIVATE_KEY = (
+    "Invalid RSA private key: The key format appears correct "
+    "but the key data is invalid. Please ensure:\n"
+    "- You're using an RSA private key (not EC, DSA, or other)\n"
+    "- The key was generated correctly\n"
+    "- You copied the entire key without modifications\n"
+    "- The key matches the public key used for encryption"
+)
+UNEXPECTED_ENCRYPTION_ERROR = (
+    "Unexpected encryption error. Please try again or contact "
+    "support if the issue persists."
+)
+UNEXPECTED_DECRYPTION_ERROR = (
+    "Unexpected decryption error. Please verify your private key "
+    "and encrypted data, or contact support if the issue persists."
+)
+
+
+def to_pem(der: bytes, label: str) -> str:
+    body = base64.b64encode(der).decode()
+    lines = [body[i : i + 64] for i in range(0, len(body), 64)]
+    return "\n".join([f"-----BEGIN {label}-----", *lines, f"-----END {label}-----"])
+
+
+def private_der(key, private_format) -> bytes:
+    return key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=private_format,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+def public_der(key, public_format) -> bytes:
+    return key.public_key().public_bytes(
+        encoding=serialization.Encoding.DER, format=public_format
+    )
+
+
+@pytest.fixture(scope="module")
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ec_key():
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+@pytest.fixture(scope="module")
+def ciphertext(rsa_key):
+    spki = public_der(rsa_key, serialization.PublicFormat.SubjectPublicKeyInfo)
+    return encrypt_data(to_pem(spki, "PUBLIC KEY"), "Hello Blueprint!")
+
+
+def assert_error(func, *args, message: str):
+    with pytest.raises(ValueError) as excinfo:
+        func(*args)
+    assert str(excinfo.value) == message
+
+
+def test_matching_labels_round_trip(rsa_key, ciphertext):
+    pkcs8 = private_der(rsa_key, serialization.PrivateFormat.PKCS8)
+    pkcs1 = private_der(rsa_key, serialization.PrivateFormat.TraditionalOpenSSL)
+
+    assert decrypt_data(to_pem(pkcs8, "PRIVATE KEY"), ciphertext) == "Hello Blueprint!"
+    assert (
+        decrypt_data(to_pem(pkcs1, "RSA PRIVATE KEY"), ciphertext) == "Hello Blueprint!"
+    )
+
+
+def test_pkcs1_public_key_under_public_key_label(rsa_key):
+    pkcs1 = public_der(rsa_key, serialization.PublicFormat.PKCS1)
+    assert_error(
+        encrypt_data, to_pem(pkcs1, "PUBLIC KEY"), "hi", message=INVALID_PUBLIC_KEY
+    )
+
+
+@pytest.mark.parametrize(
+    "private_format, label",
+    [
+        (serialization.PrivateFormat.PKCS8, "RSA PRIVATE KEY"),
+        (serialization.PrivateFormat.TraditionalOpenSSL, "PRIVATE KEY"),
+    ],
+)
+def test_private_body_under_wrong_label(rsa_key, ciphertext, private_format, label):
+    der = private_der(rsa_key, private_format)
+    assert_error(
+        decrypt_data, to_pem(der, label), ciphertext, message=INVALID_PRIVATE_KEY
+    )
+
+
+@pytest.mark.parametrize("label", ["PRIVATE KEY", "RSA PRIVATE KEY"])
+def test_public_body_under_private_label(rsa_key, ciphertext, label):
+    spki = public_der(rsa_key, serialization.PublicFormat.SubjectPublicKeyInfo)
+    assert_error(
+        decrypt_data, to_pem(spki, label), ciphertext, message=INVALID_PRIVATE_KEY
+    )
+
+
+@pytest.mark.parametrize("length", [1, 2, 4, 10, 100])
+def test_truncated_der(rsa_key, ciphertext, length):
+    spki = public_der(rsa_key, serialization.PublicFormat.SubjectPublicKeyInfo)
+    pkcs8 = private_der(rsa_key, serialization.PrivateFormat.PKCS8)
+
+    assert_error(
+        encrypt_data,
+        to_pem(spki[:length], "PUBLIC KEY"),
+        "hi",
+        message=INVALID_PUBLIC_KEY,
+    )
+    assert_error(
+        decrypt_data,
+        to_pem(pkcs8[:length], "PRIVATE KEY"),
+        ciphertext,
+        message=INVALID_PRIVATE_KEY,
+    )
+
+
+@pytest.mark.parametrize(
+    "der, label, expected",
+    [
+        # Outer SEQUENCE with a two-octet long-form length
+        (b"\x30\x82\x00\x06\x30\x00\x03\x02\x00\x00", "PUBLIC KEY", True),
+        # Long-form length on the first field, skipped to reach the second
+        (b"\x30\x81\x08\x02\x81\x01\x00\x30\x00", "PRIVATE KEY", True),
+        (b"\x30\x81\x08\x02\x81\x01\x00\x02\x01\x00", "RSA PRIVATE KEY", True),
+        (b"\x30\x81\x08\x02\x81\x01\x00\x02\x01\x00", "PRIVATE KEY", False),
+        # Long-form length pointing past the end of the data
+        (b"\x30\x84\xff\xff\xff\xff\x02\x84\xff\xff\xff\xff", "PRIVATE KEY", False),
+        # Long-form length octets cut off
+        (b"\x30\x82", "PUBLIC KEY", False),
+        # Not a SEQUENCE at all
+        (b"\x02\x01\x00", "RSA PRIVATE KEY", False),
+        (b"", "PUBLIC KEY", False),
+    ],
+)
+def test_der_label_check_with_long_form_lengths(der, label, expected):
+    assert _der_matches_label(der, label) is expected
+
+
+def test_ec_keys(ec_key, ciphertext):
+    spki = public_der(ec_key, serialization.PublicFormat.SubjectPublicKeyInfo)
+    pkcs8 = private_der(ec_key, serialization.PrivateFormat.PKCS8)
+    sec1 = private_der(ec_key, serialization.PrivateFormat.TraditionalOpenSSL)
+
+    assert_error(
+        encrypt_data,
+        to_pem(spki, "PUBLIC KEY"),
+        "hi",
+        message=UNEXPECTED_ENCRYPTION_ERROR,
+    )
+    assert_error(
+        decrypt_data,
+        to_pem(pkcs8, "PRIVATE KEY"),
+        ciphertext,
+        message=UNEXPECTED_DECRYPTION_ERROR,
+    )
+    assert_error(
+        decrypt_data,
+        to_pem(sec1, "RSA PRIVATE KEY"),
+        ciphertext,
+        message=INVALID_PRIVATE_KEY,
+    )
@@ -0,0 +1,151 @@
+# Tests for read replica routing, using SQLite files as primary and replicas
+# Run from the server directory: python -m pytest src/test_read_replicas.py
+
+import os
+import shutil
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# main creates tables on import, so keep it off the configured database
+os.environ["DATABASE_URL"] = "sqlite://"
+
+from src import database, main  # noqa: E402
+
+
+def make_sessionmaker(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def use_replicas(monkeypatch, urls):
+    engines = [create_engine(url) for url in urls]
+    monkeypatch.setattr(database, "replica_engines", engines)
+    monkeypatch.setattr(
+        database, "ReadSessionLocals", [make_sessionmaker(e) for e in engines]
+    )
+    monkeypatch.setattr(database, "_replica_down_until", [0.0] * len(engines))
+    return engines
+
+
+def read_bind():
+    db = database.get_read_session()
+    try:
+        return db.get_bind()
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def primary(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    database.Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(database, "SessionLocal", make_sessionmaker(engine))
+    with database.get_primary_session() as db:
+        for index in range(3):
+            main.create_log(db, "127.0.0.1", f"entry {index}", "encrypt")
+    return engine
+
+
+@pytest.fixture
+def replica_url(tmp_path, primary):
+    def copy(name):
+        shutil.copy(tmp_path / "primary.db", tmp_path / name)
+        return f"sqlite:///{tmp_path / name}"
+
+    return copy
+
+
+@pytest.fixture
+def unreachable_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+
+
+def test_reads_rotate_round_robin(monkeypatch, replica_url):
+    first, second = use_replicas(
+        monkeypatch, [replica_url("replica1.db"), replica_url("replica2.db")]
+    )
+
+    assert [read_bind() for _ in range(4)] == [first, second, first, second]
+
+
+def test_unreachable_replica_is_skipped_during_cooldown(
+    monkeypatch, replica_url, unreachable_url
+):
+    now = [1000.0]
+    monkeypatch.setattr(database.time, "monotonic", lambda: now[0])
+    healthy, unreachable = use_replicas(
+        monkeypatch, [replica_url("replica.db"), unreachable_url]
+    )
+    checked = []
+    is_usable = database._replica_is_usable
+
+    def record_check(db):
+        checked.append(db.get_bind())
+        return is_usable(db)
+
+    monkeypatch.setattr(database, "_replica_is_usable", record_check)
+
+    assert [read_bind() for _ in range(4)] == [healthy] * 4
+    assert checked.count(unreachable) == 1
+
+    now[0] += database.READ_REPLICA_COOLDOWN_SECONDS - 1
+    read_bind()
+    read_bind()
+    assert checked.count(unreachable) == 1
+
+    now[0] += 1
+    read_bind()
+    read_bind()
+    assert checked.count(unreachable) == 2
+
+
+def test_reads_use_primary_when_no_replica_is_usable(
+    monkeypatch, primary, unreachable_url
+):
+    use_replicas(monkeypatch, [unreachable_url])
+
+    assert read_bind() is primary
+
+
+def test_reads_use_primary_without_replicas(monkeypatch, primary):
+    use_replicas(monkeypatch, [])
+
+    assert read_bind() is primary
+
+
+def test_get_logs_retries_on_primary_and_cools_down_replica(
+    tmp_path, monkeypatch, primary
+):
+    # An empty replica answers SELECT 1 but has no logs table
+    (empty,) = use_replicas(monkeypatch, [f"sqlite:///{tmp_path / 'empty.db'}"])
+    db = database.get_read_session()
+    assert db.get_bind() is empty
+
+    try:
+        response = main.get_logs(size=10, offset=0, db=db)
+    finally:
+        db.close()
+
+    assert response.total == 3
+    assert database._replica_down_until[0] > 0
+    assert read_bind() is primary
+
+
+def test_get_logs_does_not_retry_a_failing_primary(monkeypatch, primary):
+    use_replicas(monkeypatch, [])
+    queries = []
+
+    def failing_query(db, size, offset):
+        queries.append(db.get_bind())
+        raise database.SQLAlchemyError("primary unavailable")
+
+    monkeypatch.setattr(main, "query_logs", failing_query)
+    db = database.get_read_session()
+    try:
+        with pytest.raises(database.SQLAlchemyError):
+            main.get_logs(size=10, offset=0, db=db)
+    finally:
+        db.close()
+
+    assert queries == [primary]